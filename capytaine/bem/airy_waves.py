@@ -5,37 +5,70 @@
 import numpy as np
 from capytaine.tools.lists_of_points import _normalize_points, _normalize_free_surface_points
 
-def airy_waves_potential(points, pb):
-    """Compute the potential for Airy waves at a given point (or array of points).
+def _airy_kinematics(points, pb, *, with_sih=False):
+    """Compute the factors shared by the potential and the velocity of Airy waves.
 
     Parameters
     ----------
-    points: array of shape (3) or (N x 3)
-        coordinates of the points in which to evaluate the potential.
+    points: array of shape (N x 3)
+        coordinates of the points, as returned by :code:`_normalize_points`.
     pb: DiffractionProblem
         problem with the environmental conditions (g, rho, ...) of interest
+    with_sih: bool, optional
+        if True, also compute the vertical profile of the vertical velocity.
 
     Returns
     -------
-    array of shape (1) or (N x 1)
-        The potential
+    tuple of arrays of shape (N,)
+        the vertical profiles cih and sih (None if not requested) and the phase
+        :math:`e^{i k (x \\cos \\beta + y \\sin \\beta)}`.
     """
-    points, output_shape = _normalize_points(points)
-
-    x, y, z = points.T
+    z = points[:, 2]
     k = pb.wavenumber
     h = pb.water_depth
     beta = pb.encounter_wave_direction
-    wbar = x * np.cos(beta) + y * np.sin(beta)
+
+    # The scalar coefficients are computed once and the arrays are updated in
+    # place, to avoid allocating a new temporary array at each operation.
+    wbar = points[:, :2] @ np.array([np.cos(beta), np.sin(beta)])
 
     if 0 <= k*h < 20:
-        cih = np.cosh(k*(z+h))/np.cosh(k*h)
-        # sih = np.sinh(k*(z+h))/np.cosh(k*h)
+        kzh = k*(z+h)
+        coshkh = np.cosh(k*h)
+        cih = np.cosh(kzh)
+        cih /= coshkh
+        if with_sih:
+            sih = np.sinh(kzh)
+            sih /= coshkh
+        else:
+            sih = None
     else:
         cih = np.exp(k*z)
-        # sih = np.exp(k*z)
+        sih = cih if with_sih else None
+
+    phase = np.exp(1j*k*wbar)
+    return cih, sih, phase
+
+
+def airy_waves_potential(points, pb):
+    """Compute the potential for Airy waves at a given point (or array of points).
+
+    Parameters
+    ----------
+    points: array of shape (3) or (N x 3)
+        coordinates of the points in which to evaluate the potential.
+    pb: DiffractionProblem
+        problem with the environmental conditions (g, rho, ...) of interest
 
-    phi = -1j*pb.g/pb.omega * cih * np.exp(1j * k * wbar)
+    Returns
+    -------
+    array of shape (1) or (N x 1)
+        The potential
+    """
+    points, output_shape = _normalize_points(points)
+    cih, _, phi = _airy_kinematics(points, pb)
+    phi *= cih
+    phi *= -1j*pb.g/pb.omega
     return phi.reshape(output_shape)
 
 
@@ -56,26 +89,15 @@ def airy_waves_velocity(points, pb):
     """
 
     points, output_shape = _normalize_points(points)
+    cih, sih, amplitude = _airy_kinematics(points, pb, with_sih=True)
+    amplitude *= pb.g*pb.wavenumber/pb.omega
 
-    x, y, z = points.T
-    k = pb.wavenumber
-    h = pb.water_depth
-    beta = pb.encounter_wave_direction
-
-    wbar = x * np.cos(beta) + y * np.sin(beta)
-
-    if 0 <= k*h < 20:
-        cih = np.cosh(k*(z+h))/np.cosh(k*h)
-        sih = np.sinh(k*(z+h))/np.cosh(k*h)
-    else:
-        cih = np.exp(k*z)
-        sih = np.exp(k*z)
-
-    v = pb.g*k/pb.omega * \
-        np.exp(1j * k * wbar) * \
-        np.array([np.cos(pb.wave_direction) * cih, np.sin(pb.wave_direction) * cih, -1j * sih])
+    v = np.empty((points.shape[0], 3), dtype=complex)
+    np.multiply(amplitude, np.cos(pb.wave_direction) * cih, out=v[:, 0])
+    np.multiply(amplitude, np.sin(pb.wave_direction) * cih, out=v[:, 1])
+    np.multiply(amplitude, -1j * sih, out=v[:, 2])
 
-    return v.T.reshape((*output_shape, 3))
+    return v.reshape((*output_shape, 3))
 
 
 def airy_waves_pressure(points, pb):
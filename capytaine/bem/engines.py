@@ -10,6 +10,7 @@ from scipy.linalg import lu_factor
 from scipy.sparse import coo_matrix
 from scipy.sparse import linalg as ssl
 
+from capytaine.meshes.meshes import Mesh
 from capytaine.meshes.collections import CollectionOfMeshes
 from capytaine.meshes.symmetric import ReflectionSymmetricMesh, TranslationalSymmetricMesh, AxialSymmetricMesh
 
@@ -189,6 +190,58 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
                            adjoint_double_layer, _rec_depth=1)
 
 
+    def _use_ACA(self, mesh1, mesh2):
+        """Whether the meshes are far enough from each other to try a low-rank approximation of their interaction."""
+        distance = np.linalg.norm(mesh1.center_of_mass_of_nodes - mesh2.center_of_mass_of_nodes)
+        return distance > self.ACA_distance*mesh1.diameter_of_nodes or distance > self.ACA_distance*mesh2.diameter_of_nodes
+
+    def _build_blocks_with_shared_mesh(self,
+                                       shared_mesh, other_meshes, axis, free_surface, water_depth, wavenumber, green_function,
+                                       adjoint_double_layer, _rec_depth=1):
+        """Build the influence matrices between :code:`shared_mesh` and each mesh of :code:`other_meshes`.
+
+        If :code:`axis` is 1, :code:`shared_mesh` is the receiving mesh and the blocks form a line of a block matrix.
+        If :code:`axis` is 0, :code:`shared_mesh` is the source mesh and the blocks form a column of a block matrix.
+
+        The blocks that would be plain numpy arrays are computed with a single call
+        to the Green function with the collection of the corresponding meshes,
+        instead of one call per block.
+
+        Returns
+        -------
+        tuple of lists of matrix-like
+            the blocks of :math:`S` and the blocks of :math:`K`
+        """
+        blocks = [None] * len(other_meshes)
+
+        # The interaction of a mesh with itself is excluded, since the Green function treats it specifically.
+        dense_ids = [i for i, other_mesh in enumerate(other_meshes)
+                     if isinstance(shared_mesh, Mesh) and isinstance(other_mesh, Mesh)
+                     and other_mesh is not shared_mesh and not self._use_ACA(shared_mesh, other_mesh)]
+
+        if len(dense_ids) > 1:
+            LOG.debug("\t" * (_rec_depth+1) +
+                      "Build the S and K influence matrices between %s and %d other meshes at once",
+                      shared_mesh.name, len(dense_ids))
+            collection = CollectionOfMeshes([other_meshes[i] for i in dense_ids])
+            if axis == 1:
+                S, V = green_function.evaluate(shared_mesh, collection, free_surface, water_depth, wavenumber, adjoint_double_layer=adjoint_double_layer)
+            else:
+                S, V = green_function.evaluate(collection, shared_mesh, free_surface, water_depth, wavenumber, adjoint_double_layer=adjoint_double_layer)
+            split_indices = np.cumsum([other_meshes[i].nb_faces for i in dense_ids])[:-1]
+            for i, S_block, V_block in zip(dense_ids, np.split(S, split_indices, axis=axis), np.split(V, split_indices, axis=axis)):
+                blocks[i] = (S_block, V_block)
+
+        for i, other_mesh in enumerate(other_meshes):
+            if blocks[i] is None:
+                mesh1, mesh2 = (shared_mesh, other_mesh) if axis == 1 else (other_mesh, shared_mesh)
+                blocks[i] = self._build_matrices(
+                    mesh1, mesh2, free_surface, water_depth, wavenumber, green_function,
+                    adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth)
+
+        S_list, V_list = zip(*blocks)
+        return list(S_list), list(V_list)
+
     def _build_matrices(self,
                        mesh1, mesh2, free_surface, water_depth, wavenumber, green_function,
                        adjoint_double_layer, _rec_depth=1):
@@ -199,7 +252,7 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
         :code:`_rec_depth` keeps track of the recursion depth only for pretty log printing.
         """
 
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
+        if LOG.isEnabledFor(logging.DEBUG):
             log_entry = (
                 "\t" * (_rec_depth+1) +
                 "Build the S and K influence matrices between {mesh1} and {mesh2}"
@@ -208,9 +261,6 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
         else:
             log_entry = ""  # will not be used
 
-        # Distance between the meshes (for ACA).
-        distance = np.linalg.norm(mesh1.center_of_mass_of_nodes - mesh2.center_of_mass_of_nodes)
-
         # I) SPARSE COMPUTATION
         # I-i) BLOCK TOEPLITZ MATRIX
 
@@ -218,7 +268,7 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
                 and isinstance(mesh2, ReflectionSymmetricMesh)
                 and mesh1.plane == mesh2.plane):
 
-            LOG.debug(log_entry + " using mirror symmetry.")
+            LOG.debug("%s using mirror symmetry.", log_entry)
 
             S_a, V_a = self._build_matrices(
                 mesh1[0], mesh2[0], free_surface, water_depth, wavenumber, green_function,
@@ -234,46 +284,35 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
               and np.allclose(mesh1.translation, mesh2.translation)
               and mesh1.nb_submeshes == mesh2.nb_submeshes):
 
-            LOG.debug(log_entry + " using translational symmetry.")
+            LOG.debug("%s using translational symmetry.", log_entry)
 
-            S_list, V_list = [], []
-            for submesh in mesh2:
-                S, V = self._build_matrices(
-                    mesh1[0], submesh, free_surface, water_depth, wavenumber, green_function,
-                    adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth+1)
-                S_list.append(S)
-                V_list.append(V)
-            for submesh in mesh1[1:][::-1]:
-                S, V = self._build_matrices(
-                    submesh, mesh2[0], free_surface, water_depth, wavenumber, green_function,
-                    adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth+1)
-                S_list.append(S)
-                V_list.append(V)
+            S_list, V_list = self._build_blocks_with_shared_mesh(
+                mesh1[0], list(mesh2), 1, free_surface, water_depth, wavenumber, green_function,
+                adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth+1)
+            S_column, V_column = self._build_blocks_with_shared_mesh(
+                mesh2[0], list(mesh1[1:][::-1]), 0, free_surface, water_depth, wavenumber, green_function,
+                adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth+1)
 
-            return BlockToeplitzMatrix([S_list]), BlockToeplitzMatrix([V_list])
+            return BlockToeplitzMatrix([S_list + S_column]), BlockToeplitzMatrix([V_list + V_column])
 
         elif (isinstance(mesh1, AxialSymmetricMesh)
               and isinstance(mesh2, AxialSymmetricMesh)
               and mesh1.axis == mesh2.axis
               and mesh1.nb_submeshes == mesh2.nb_submeshes):
 
-            LOG.debug(log_entry + " using rotation symmetry.")
+            LOG.debug("%s using rotation symmetry.", log_entry)
 
-            S_line, V_line = [], []
-            for submesh in mesh2[:mesh2.nb_submeshes]:
-                S, V = self._build_matrices(
-                    mesh1[0], submesh, free_surface, water_depth, wavenumber, green_function,
-                    adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth+1)
-                S_line.append(S)
-                V_line.append(V)
+            S_line, V_line = self._build_blocks_with_shared_mesh(
+                mesh1[0], list(mesh2[:mesh2.nb_submeshes]), 1, free_surface, water_depth, wavenumber, green_function,
+                adjoint_double_layer=adjoint_double_layer, _rec_depth=_rec_depth+1)
 
             return BlockCirculantMatrix([S_line]), BlockCirculantMatrix([V_line])
 
         # I-ii) LOW-RANK MATRIX WITH ACA
 
-        elif distance > self.ACA_distance*mesh1.diameter_of_nodes or distance > self.ACA_distance*mesh2.diameter_of_nodes:
+        elif self._use_ACA(mesh1, mesh2):
 
-            LOG.debug(log_entry + " using ACA.")
+            LOG.debug("%s using ACA.", log_entry)
 
             def get_row_func(i):
                 s, v = green_function.evaluate(
@@ -305,7 +344,7 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
         if (isinstance(mesh1, CollectionOfMeshes)
               and isinstance(mesh2, CollectionOfMeshes)):
 
-            LOG.debug(log_entry + " using block matrix structure.")
+            LOG.debug("%s using block matrix structure.", log_entry)
 
             S_matrix, V_matrix = [], []
             for submesh1 in mesh1:
@@ -325,7 +364,7 @@ class HierarchicalToeplitzMatrixEngine(MatrixEngine):
         # II-ii) PLAIN NUMPY ARRAY
 
         else:
-            LOG.debug(log_entry)
+            LOG.debug("%s", log_entry)
 
             S, V = green_function.evaluate(
                 mesh1, mesh2, free_surface, water_depth, wavenumber, adjoint_double_layer=adjoint_double_layer
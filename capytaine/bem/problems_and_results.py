@@ -235,9 +235,13 @@ class LinearPotentialFlowProblem:
         """Given a list of problems, returns a list of groups of problems, such
         that each group should be executed in the same process to benefit from
         caching.
+
+        The problems are grouped according to the parameters on which the
+        influence matrices depend. In particular, problems differing only by
+        `rho` share the same matrices and are kept in the same group.
         """
         problems_params = pd.DataFrame([pb._asdict() for pb in problems])
-        groups_of_indices = problems_params.groupby(["body_name", "water_depth", "omega", "rho", "g"]).groups.values()
+        groups_of_indices = problems_params.groupby(["body_name", "water_depth", "encounter_omega", "g"]).groups.values()
         groups_of_problems = [[problems[i] for i in grp] for grp in groups_of_indices]
         return groups_of_problems
 
@@ -427,7 +427,7 @@ class BEMSolver:
                 )
                 phi[i:i+chunk_size] = S @ result.sources
 
-        LOG.debug(f"Done computing potential on {mesh.name} for {result}.")
+        LOG.debug("Done computing potential on %s for %s.", mesh.name, result)
 
         return phi
 
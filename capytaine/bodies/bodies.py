@@ -204,14 +204,15 @@ class FloatingBody(ClippableMixin, Abstract3DObject):
         self.add_rotation_dof(name="Yaw")
 
     def integrate_pressure(self, pressure):
-        forces = {}
-        for dof_name in self.dofs:
-            # Scalar product on each face:
-            normal_dof_amplitude_on_face = - np.sum(self.dofs[dof_name] * self.mesh.faces_normals, axis=1)
-            # The minus sign in the above line is because we want the force of the fluid on the body and not the force of the body on the fluid.
-            # Sum over all faces:
-            forces[dof_name] = np.sum(pressure * normal_dof_amplitude_on_face * self.mesh.faces_areas)
-        return forces
+        if len(self.dofs) == 0:
+            return {}
+        # Scalar product on each face, times the area of the face, for all dofs at once:
+        all_dofs = np.stack([self.dofs[dof_name] for dof_name in self.dofs])  # shape: (nb_dofs, nb_faces, 3)
+        normal_dof_amplitude_on_faces = - np.einsum('dfi,fi,f->df', all_dofs, self.mesh.faces_normals, self.mesh.faces_areas)
+        # The minus sign in the above line is because we want the force of the fluid on the body and not the force of the body on the fluid.
+        # Sum over all faces:
+        forces = normal_dof_amplitude_on_faces @ pressure
+        return {dof_name: forces[i] for i, dof_name in enumerate(self.dofs)}
 
     @inplace_transformation
     def keep_only_dofs(self, dofs):
@@ -789,10 +790,10 @@ respective inertia coefficients are assigned as NaN.")
         new_body = copy.deepcopy(self)
         if name is None:
             new_body.name = f"copy_of_{self.name}"
-            LOG.debug(f"Copy {self.name}.")
+            LOG.debug("Copy %s.", self.name)
         else:
             new_body.name = name
-            LOG.debug(f"Copy {self.name} under the name {name}.")
+            LOG.debug("Copy %s under the name %s.", self.name, name)
         return new_body
 
     def assemble_regular_array(self, distance, nb_bodies):
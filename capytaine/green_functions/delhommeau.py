@@ -194,7 +194,6 @@ class Delhommeau(AbstractGreenFunction):
                 values=self.tabulated_integrals
             )
 
-    @lru_cache(maxsize=128)
     def find_best_exponential_decomposition(self, dimensionless_omega, dimensionless_wavenumber):
         """Compute the decomposition of a part of the finite water_depth Green function as a sum of exponential functions.
 
@@ -219,27 +218,36 @@ class Delhommeau(AbstractGreenFunction):
         Tuple[np.ndarray, np.ndarray]
             the amplitude and growth rates of the exponentials
         """
+        # The parameters are rounded to 12 significant digits, such that values
+        # differing only by round-off errors share the same entry of the cache.
+        return self._find_best_exponential_decomposition(
+            float(f"{dimensionless_omega:.12g}"),
+            float(f"{dimensionless_wavenumber:.12g}"),
+        )
 
-        LOG.debug(f"\tCompute Prony decomposition in finite water_depth Green function "
-                  f"for dimless_omega=%.2e and dimless_wavenumber=%.2e",
+    @lru_cache(maxsize=128)
+    def _find_best_exponential_decomposition(self, dimensionless_omega, dimensionless_wavenumber):
+        LOG.debug("\tCompute Prony decomposition in finite water_depth Green function "
+                  "for dimless_omega=%.2e and dimless_wavenumber=%.2e",
                   dimensionless_omega, dimensionless_wavenumber)
 
         if self.finite_depth_prony_decomposition_method.lower() == 'python':
             # The function that will be approximated.
-            @np.vectorize
             def f(x):
-                return self.fortran_core.initialize_green_wave.ff(x, dimensionless_omega, dimensionless_wavenumber)
+                return self.fortran_core.old_prony_decomposition.ff_array(x, dimensionless_omega, dimensionless_wavenumber).astype(np.float64)
 
             # Try different increasing number of exponentials
             for n_exp in range(4, 31, 2):
 
-                # The coefficients are computed on a resolution of 4*n_exp+1 ...
-                X = np.linspace(-0.1, 20.0, 4*n_exp+1)
-                a, lamda = exponential_decomposition(X, f(X), n_exp)
-
-                # ... and they are evaluated on a finer discretization.
+                # The function is sampled once on a resolution of 8*n_exp+1 ...
                 X = np.linspace(-0.1, 20.0, 8*n_exp+1)
-                if error_exponential_decomposition(X, f(X), a, lamda) < 1e-4:
+                F = f(X)
+
+                # ... the coefficients are computed on every other point, that is a resolution of 4*n_exp+1 ...
+                a, lamda = exponential_decomposition(X[::2], F[::2], n_exp)
+
+                # ... and they are evaluated on the finer discretization.
+                if error_exponential_decomposition(X, F, a, lamda) < 1e-4:
                     break
 
             else:
@@ -347,6 +355,9 @@ class Delhommeau(AbstractGreenFunction):
         K = np.empty((nb_collocation_points, mesh2.nb_faces, 1 if early_dot_product else 3), order="F", dtype=dtype)
 
         # Main call to Fortran code
+        # The Rankine part, the reflected Rankine part and the wave part are all
+        # computed in the same OpenMP parallel loop over the faces of mesh2, so
+        # they should not be dispatched to separate Python threads.
         self.fortran_core.matrices.build_matrices(
             collocation_points,  early_dot_product_normals,
             mesh2.vertices,      mesh2.faces + 1,
@@ -361,7 +372,11 @@ class Delhommeau(AbstractGreenFunction):
             S, K
         )
 
-        if np.any(np.isnan(S)) or np.any(np.isnan(K)):
+        # A NaN anywhere in the matrices propagates to their sum.
+        # Checking the sum avoids allocating two boolean arrays of the size of the matrices in the usual case.
+        # The sum can also be NaN without any NaN in the matrix (e.g. inf - inf), hence the full check.
+        if ((np.isnan(np.sum(S)) and np.isnan(S).any())
+                or (np.isnan(np.sum(K)) and np.isnan(K).any())):
             raise RuntimeError("Green function returned a NaN in the interaction matrix.\n"
                     "It could be due to overlapping panels.")
 
@@ -16,6 +16,7 @@ MODULE Old_Prony_decomposition
 ! Unlike most of the rest of the Fortran code, these functions are only in single precision.
 
   PUBLIC :: FF
+  PUBLIC :: FF_ARRAY ! Vectorized version of FF, for the Python implementation
   PUBLIC :: LISC   ! Initialization of AMBDA and AR
   PUBLIC :: EXPORS ! Called by LISC
   PUBLIC :: MCAS   ! Called by EXPORS
@@ -52,6 +53,26 @@ CONTAINS
     ENDIF
   END FUNCTION FF
 
+  SUBROUTINE FF_ARRAY(N, K, K0, M0, F)
+    ! Evaluate FF on each of the values of the array K.
+    ! Looping in Fortran avoids calling the Fortran code from Python once per value.
+
+    ! Inputs
+    INTEGER, INTENT(IN)               :: N
+    REAL, DIMENSION(N), INTENT(IN)    :: K
+    REAL, INTENT(IN)                  :: K0, M0
+
+    ! Output
+    REAL, DIMENSION(N), INTENT(OUT)   :: F
+
+    ! Local variables
+    INTEGER :: I
+
+    DO I = 1, N
+      F(I) = FF(K(I), K0, M0)
+    END DO
+  END SUBROUTINE FF_ARRAY
+
 
   SUBROUTINE LISC(AK0, wavenumber, &
                   AMBDA, AR, NEXP)
@@ -21,7 +21,7 @@ from capytaine.bodies.bodies import FloatingBody
 from capytaine.bem.problems_and_results import (
     LinearPotentialFlowProblem, DiffractionProblem, RadiationProblem,
     LinearPotentialFlowResult, _default_parameters)
-from capytaine.post_pro.kochin import compute_kochin
+from capytaine.post_pro.kochin import compute_kochin_of_several_results
 from capytaine.io.bemio import dataframe_from_bemio
 
 
@@ -219,14 +219,16 @@ def kochin_data_array(results: Sequence[LinearPotentialFlowResult],
 
     .. seealso::
         :meth:`~capytaine.post_pro.kochin.compute_kochin`
-            The present function is just a wrapper around :code:`compute_kochin`.
+            The present function is just a wrapper around :code:`compute_kochin_of_several_results`.
     """
-    records = pd.DataFrame([
-        dict(**result.problem._asdict(), theta=theta, kochin=kochin, kind=result.__class__.__name__)
-        for result in results
-        for theta, kochin in zip(theta_range.data,
-                                 compute_kochin(result, theta_range, **kwargs))
-    ])
+    theta_range = np.asarray(theta_range)
+    # One DataFrame per result, in which the parameters of the problem are broadcasted along theta.
+    records = pd.concat([
+        pd.DataFrame(dict(**result.problem._asdict(), theta=theta_range,
+                          kochin=kochin,
+                          kind=result.__class__.__name__))
+        for result, kochin in zip(results, compute_kochin_of_several_results(results, theta_range, **kwargs))
+    ], ignore_index=True)
 
     kochin_data = xr.Dataset()
 
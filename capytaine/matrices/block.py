@@ -70,7 +70,7 @@ class BlockMatrix:
         # Total shape of the full matrix
         self.shape = self._compute_shape()
 
-        LOG.debug(f"New block matrix: %s", self)
+        LOG.debug("New block matrix: %s", self)
 
         if check:
             assert self._check_dimensions_of_blocks()
@@ -229,14 +229,14 @@ class BlockMatrix:
 
     def _apply_unary_op(self, op: Callable) -> 'BlockMatrix':
         """Helper function applying a function recursively on all submatrices."""
-        LOG.debug(f"Apply op {op.__name__} to {self}")
+        LOG.debug("Apply op %s to %s", op.__name__, self)
         result = [[op(block) for block in line] for line in self._stored_blocks]
         return self.__class__(result, _stored_block_shapes=self._stored_block_shapes, check=False)
 
     def _apply_binary_op(self, op: Callable, other: 'BlockMatrix') -> 'BlockMatrix':
         """Helper function applying a binary operator recursively on all submatrices."""
         if isinstance(other, self.__class__) and self.nb_blocks == other.nb_blocks:
-            LOG.debug(f"Apply op {op.__name__} to {self} and {other}")
+            LOG.debug("Apply op %s to %s and %s", op.__name__, self, other)
             result = [
                 [op(block, other_block) for block, other_block in zip(line, other_line)]
                 for line, other_line in zip(self._stored_blocks, other._stored_blocks)
@@ -292,7 +292,7 @@ class BlockMatrix:
     def matvec(self, other):
         """Matrix vector product.
         Named as such to be used as scipy LinearOperator."""
-        LOG.debug(f"Multiplication of {self} with a full vector of size {other.shape}.")
+        LOG.debug("Multiplication of %s with a full vector of size %s.", self, other.shape)
         result = np.zeros(self.shape[0], dtype=other.dtype)
         line_heights = self.block_shapes[0]
         line_positions = list(accumulate(chain([0], line_heights)))
@@ -308,7 +308,7 @@ class BlockMatrix:
     def rmatvec(self, other):
         """Vector matrix product.
         Named as such to be used as scipy LinearOperator."""
-        LOG.debug(f"Multiplication of a full vector of size {other.shape} with {self}.")
+        LOG.debug("Multiplication of a full vector of size %s with %s.", other.shape, self)
         result = np.zeros(self.shape[1], dtype=other.dtype)
         line_heights = self.block_shapes[0]
         line_positions = list(accumulate(chain([0], line_heights)))
@@ -327,7 +327,7 @@ class BlockMatrix:
     def matmat(self, other):
         """Matrix-matrix product."""
         if isinstance(other, BlockMatrix) and self.block_shapes[1] == other.block_shapes[0]:
-            LOG.debug(f"Multiplication of %s with %s", self, other)
+            LOG.debug("Multiplication of %s with %s", self, other)
             own_blocks = self.all_blocks
             other_blocks = np.moveaxis(other.all_blocks, 1, 0)
             new_matrix = []
@@ -339,7 +339,7 @@ class BlockMatrix:
             return BlockMatrix(new_matrix, check=False)
 
         elif isinstance(other, np.ndarray) and self.shape[1] == other.shape[0]:
-            LOG.debug(f"Multiplication of {self} with a full matrix of shape {other.shape}.")
+            LOG.debug("Multiplication of %s with a full matrix of shape %s.", self, other.shape)
             # Cut the matrix and recursively call itself to use the code above.
             from capytaine.matrices.builders import cut_matrix
             cut_other = cut_matrix(other, self.block_shapes[1], [other.shape[1]], check=False)
@@ -383,7 +383,7 @@ class BlockMatrix:
         class_of_matrices = type(block_matrices[0])
         nb_blocks = block_matrices[0]._stored_nb_blocks
 
-        LOG.debug(f"FFT of {len(block_matrices)} {class_of_matrices.__name__} (stored blocks = {nb_blocks})")
+        LOG.debug("FFT of %d %s (stored blocks = %s)", len(block_matrices), class_of_matrices.__name__, nb_blocks)
 
         if check:
             # Check the validity of the shapes of the matrices given as input
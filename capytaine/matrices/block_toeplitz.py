@@ -118,7 +118,7 @@ class BlockToeplitzMatrix(BlockMatrix):
     def matvec(self, other):
         """Matrix vector product.
         Named as such to be used as scipy LinearOperator."""
-        LOG.debug(f"Product of {self} with vector of shape {other.shape}")
+        LOG.debug("Product of %s with vector of shape %s", self, other.shape)
         A = self.circulant_super_matrix
         b = np.concatenate([other, np.zeros(A.shape[1] - self.shape[1])])
         return (A @ b)[:self.shape[0]]
@@ -126,7 +126,7 @@ class BlockToeplitzMatrix(BlockMatrix):
     def rmatvec(self, other):
         """Matrix vector product.
         Named as such to be used as scipy LinearOperator."""
-        LOG.debug(f"Product of vector of shape {other.shape} with {self}")
+        LOG.debug("Product of vector of shape %s with %s", other.shape, self)
         if other.ndim == 2 and other.shape[0] == 1:  # Actually a 1×N matrix
             other = other[0, :]
         A = self.circulant_super_matrix
@@ -211,7 +211,7 @@ class BlockCirculantMatrix(BlockToeplitzMatrix):
     def matvec(self, other):
         """Matrix vector product.
         Named as such to be used as scipy LinearOperator."""
-        LOG.debug(f"Product of {self} with vector of shape {other.shape}")
+        LOG.debug("Product of %s with vector of shape %s", self, other.shape)
         fft_of_vector = np.fft.fft(np.reshape(other, (self.nb_blocks[0], self.block_shape[1], 1)), axis=0)
         blocks_of_diagonalization = self.block_diagonalize()
         try:  # Try to run it as vectorized numpy arrays.
@@ -51,7 +51,7 @@ def solve_directly(A, b):
         return solve_directly(A.full_matrix(), b)
 
     elif isinstance(A, np.ndarray):
-        LOG.debug(f"\tSolve linear system (size: {A.shape}) with numpy direct solver.")
+        LOG.debug("\tSolve linear system (size: %s) with numpy direct solver.", A.shape)
         return np.linalg.solve(A, b)
 
     else:
@@ -68,6 +68,7 @@ class LUSolverWithCache:
     1. @lru_cache does not work because numpy arrays are not hashable. So a basic cache system has been recoded from scratch.
     2. To be the default solver for the BasicMatrixEngine, the solver needs to support matrices for problems with one or two reflection symmetries.
     Hence, a custom way to cache the LU decomposition of the matrices involved in the direct linear resolution of the symmetric problem.
+    The same is done for BlockCirculantMatrix, whose block diagonalization is computed with a FFT.
     """
     def __init__(self):
         self.cached_matrix = None
@@ -79,22 +80,25 @@ class LUSolverWithCache:
     def lu_decomp(self, A):
         """Return the LU decomposition of A.
         If A is BlockSymmetricToeplitzMatrix, then return a list of LU decompositions for each block of the block diagonalisation of the matrix.
+        If A is BlockCirculantMatrix, then return a BlockCirculantLUDecomposition storing the LU decompositions of each block of its block diagonalisation.
         """
         if isinstance(A, BlockSymmetricToeplitzMatrix) and A.nb_blocks == (2, 2):
             A1, A2 = A._stored_blocks[0, :]
             return [self.lu_decomp(A1 + A2), self.lu_decomp(A1 - A2)]
+        elif isinstance(A, BlockCirculantMatrix):
+            return BlockCirculantLUDecomposition([self.lu_decomp(block) for block in A.block_diagonalize()])
         elif isinstance(A, np.ndarray):
             return sl.lu_factor(A)
         else:
-            raise NotImplementedError("Cached LU solver is only implemented for dense matrices and 2×2 BlockSymmetricToeplitzMatrix.")
+            raise NotImplementedError("Cached LU solver is only implemented for dense matrices, 2×2 BlockSymmetricToeplitzMatrix and BlockCirculantMatrix.")
 
     def cached_lu_decomp(self, A):
         if not(A is self.cached_matrix):
             self.cached_matrix = A
-            LOG.debug(f"Computing and caching LU decomposition")
+            LOG.debug("Computing and caching LU decomposition")
             self.cached_decomp = self.lu_decomp(A)
         else:
-            LOG.debug(f"Using cached LU decomposition")
+            LOG.debug("Using cached LU decomposition")
         return self.cached_decomp
 
     def solve_with_decomp(self, decomp, b):
@@ -107,10 +111,25 @@ class LUSolverWithCache:
             x_plus = self.solve_with_decomp(decomp[0], b1 + b2)
             x_minus = self.solve_with_decomp(decomp[1], b1 - b2)
             return np.concatenate([x_plus + x_minus, x_plus - x_minus])/2
+        elif isinstance(decomp, BlockCirculantLUDecomposition):  # The matrix was a BlockCirculantMatrix
+            nb_blocks = len(decomp.blocks_decomps)
+            fft_of_rhs = np.fft.fft(np.reshape(b, (nb_blocks, len(b)//nb_blocks)), axis=0)
+            fft_of_result = np.array([self.solve_with_decomp(block_decomp, vec) for block_decomp, vec in zip(decomp.blocks_decomps, fft_of_rhs)])
+            return np.fft.ifft(fft_of_result, axis=0).reshape((len(b),))
         elif isinstance(decomp, tuple):  # The matrix was a np.ndarray
             return sl.lu_solve(decomp, b)
         else:
-            raise NotImplementedError("Cached LU solver is only implemented for dense matrices and 2×2 BlockSymmetricToeplitzMatrix.")
+            raise NotImplementedError("Cached LU solver is only implemented for dense matrices, 2×2 BlockSymmetricToeplitzMatrix and BlockCirculantMatrix.")
+
+
+class BlockCirculantLUDecomposition:
+    """LU decompositions of the blocks of the block diagonalization of a BlockCirculantMatrix.
+
+    The block diagonalization is computed once with a FFT along the blocks,
+    such that each new right-hand side only costs a FFT and a triangular solve for each block.
+    """
+    def __init__(self, blocks_decomps):
+        self.blocks_decomps = blocks_decomps
 
 
 # ITERATIVE SOLVER
@@ -124,7 +143,17 @@ class Counter:
 
 
 def solve_gmres(A, b):
-    LOG.debug(f"Solve with GMRES for {A}.")
+    if isinstance(A, BlockCirculantMatrix):
+        # The block circulant matrix is block diagonalized by a discrete
+        # Fourier transform along the blocks. Each of the resulting
+        # independent smaller systems is solved with GMRES.
+        LOG.debug("\tSolve linear system %s with GMRES on each block of its block diagonalization.", A)
+        blocks_of_diagonalization = A.block_diagonalize()
+        fft_of_rhs = np.fft.fft(np.reshape(b, (A.nb_blocks[0], A.block_shape[0])), axis=0)
+        fft_of_result = np.array([solve_gmres(block, vec) for block, vec in zip(blocks_of_diagonalization, fft_of_rhs)])
+        return np.fft.ifft(fft_of_result, axis=0).reshape((A.shape[1],))
+
+    LOG.debug("Solve with GMRES for %s.", A)
 
     if LOG.isEnabledFor(logging.INFO):
         counter = Counter()
@@ -142,7 +171,7 @@ def solve_gmres(A, b):
     return x
 
 def gmres_no_fft(A, b):
-    LOG.debug(f"Solve with GMRES for {A} without using FFT.")
+    LOG.debug("Solve with GMRES for %s without using FFT.", A)
 
     x, info = ssl.gmres(A.no_toeplitz() if isinstance(A, BlockMatrix) else A, b, atol=1e-6)
 
@@ -215,7 +244,7 @@ def solve_precond_gmres(A_and_precond_data, b):
 
     Pinvb = _block_Jacobi_coarse_corr(A, b, np.zeros(N, dtype=complex), R, RA, AcLU, DLU, diag_shapes, n)
 
-    LOG.debug(f"Solve with GMRES for {A}.")
+    LOG.debug("Solve with GMRES for %s.", A)
 
     if LOG.isEnabledFor(logging.INFO):
         counter = Counter()
@@ -293,7 +293,7 @@ class LowRankMatrix:
             squared_norm_of_low_rank_approximation += squared_norm_of_increment + 2*np.real(crossed_terms)
 
             if squared_norm_of_increment <= tol**2*squared_norm_of_low_rank_approximation:
-                LOG.debug(f"The ACA has found an approximation of rank {l}.")
+                LOG.debug("The ACA has found an approximation of rank %d.", l)
 
                 if l == 0:  # Edge case of the zero matrix, ...
                     l = 1  # ... we actually return a "rank 1" LowRankMatrix with coefficients equal to zero.
@@ -338,17 +338,29 @@ class LowRankMatrix:
     ####################
 
     def recompress(self, tol=None, new_rank=None):
-        """Recompress the matrix to a lower rank. Based on the routine hmxQRSVD.m from Gipsylab."""
+        """Recompress the matrix to a lower rank. Based on the routine hmxQRSVD.m from Gipsylab.
+
+        Parameters
+        ----------
+        tol: float, optional
+            The tolerance on the relative error in Frobenius norm, as for the ACA:
+            the smallest rank such that the norm of the discarded singular values
+            is lower than tol times the norm of all the singular values is kept.
+        new_rank: int, optional
+            The rank of the recompressed matrix, if tol is not given (default: unchanged rank).
+        """
         if new_rank is None:
             new_rank = self.rank
         QA, RA = np.linalg.qr(self.left_matrix)
         QB, RB = np.linalg.qr(self.right_matrix.T)
-        U, S, V = np.linalg.svd(RA @ RB.T)
+        U, S, Vh = np.linalg.svd(RA @ RB.T)
         if tol is not None:
-            new_rank = np.count_nonzero(S/S[0] >= tol)
-        A = QA @ (U[:, :new_rank] @ np.diag(S[:new_rank]))
-        B = QB @ V[:, :new_rank]
-        return LowRankMatrix(A, B.T)
+            # norm_of_tails[r] is the Frobenius norm of the error when truncating to rank r.
+            norm_of_tails = np.sqrt(np.append(np.cumsum(S[::-1]**2)[::-1], 0.0))
+            new_rank = max(1, int(np.argmax(norm_of_tails <= tol*norm_of_tails[0])))
+        A = QA @ (U[:, :new_rank] * S[:new_rank])
+        B = Vh[:new_rank, :] @ QB.T
+        return LowRankMatrix(A, B)
 
     def __add__(self, other):
         if isinstance(other, LowRankMatrix):
@@ -16,6 +16,15 @@ from capytaine.meshes.meshes import Mesh
 LOG = logging.getLogger(__name__)
 
 
+def indent_tree_view_lines(lines, last=False):
+    """Prefix the lines of the tree view of a submesh, to be included in the tree view of its parent."""
+    if last:
+        prefix, shift = ' └─', '   '
+    else:
+        prefix, shift = ' ├─', ' │ '
+    return [prefix + lines[0]] + [shift + line for line in lines[1:]]
+
+
 class CollectionOfMeshes(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject):
     """A tuple of meshes.
     It gives access to all the vertices of all the sub-meshes as if it were a mesh itself.
@@ -41,7 +50,7 @@ class CollectionOfMeshes(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject
         else:
             self.name = str(name)
 
-        LOG.debug(f"New collection of meshes: {repr(self)}")
+        LOG.debug("New collection of meshes: %r", self)
 
     def __short_str__(self):
         return (f"{self.__class__.__name__}(..., name=\"{self.name}\")")
@@ -88,18 +97,15 @@ class CollectionOfMeshes(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject
         return hash(self._meshes)
 
     def tree_view(self, **kwargs):
-        body_tree_views = []
+        return '\n'.join(self._tree_view_lines(**kwargs))
+
+    def _tree_view_lines(self, **kwargs):
+        """The lines of the tree view. They are only joined at the top level,
+        such that the tree views of the submeshes are not scanned again at each level."""
+        lines = [self.__short_str__()]
         for i, mesh in enumerate(self):
-            tree_view = mesh.tree_view(**kwargs)
-            if i == len(self)-1:
-                prefix = ' └─'
-                shift  = '   '
-            else:
-                prefix = ' ├─'
-                shift  = ' │ '
-            body_tree_views.append(prefix + tree_view.replace('\n', '\n' + shift))
-
-        return self.__short_str__() + '\n' + '\n'.join(body_tree_views)
+            lines.extend(indent_tree_view_lines(mesh._tree_view_lines(**kwargs), last=(i == len(self)-1)))
+        return lines
 
     def path_to_leaf(self):
         """
@@ -189,10 +189,20 @@ class Axis(Abstract3DObject):
     def __init__(self, vector=(1, 0, 0), point=(0, 0, 0)):
         assert len(vector) == 3, "Vector of an axis should be given as a 3-ple of values."
         assert len(point) == 3, "Point of an axis should be given as a 3-ple of values."
+        self.__internals__ = dict()
         vector = np.array(vector, float)
-        self.vector = vector / np.linalg.norm(vector)
+        self.vector = vector / np.linalg.norm(vector)  # Not a direct assignment, goes through the setter method below.
         self.point = np.array(point, float)
 
+    @property
+    def vector(self):
+        return self._vector
+
+    @vector.setter
+    def vector(self, value):
+        self._vector = value
+        self.__internals__.clear()
+
     def __repr__(self):
         return f"Axis(vector={self.vector}, point={self.point})"
 
@@ -260,13 +270,24 @@ class Axis(Abstract3DObject):
     #  Other  #
     ###########
 
+    @property
+    def _cross_product_matrices(self):
+        """The matrix W of the cross product with the vector of the axis and its square W @ W,
+        used in Rodrigues' formula. Cached since they do not depend on the rotation angle."""
+        if 'cross_product_matrices' not in self.__internals__:
+            ux, uy, uz = self.vector
+            W = np.array([[0, -uz, uy],
+                          [uz, 0, -ux],
+                          [-uy, ux, 0]])
+            self.__internals__['cross_product_matrices'] = (W, W @ W)
+        return self.__internals__['cross_product_matrices']
+
     def rotation_matrix(self, theta):
-        """Rotation matrix around the vector according to Rodrigues' formula."""
-        ux, uy, uz = self.vector
-        W = np.array([[0, -uz, uy],
-                      [uz, 0, -ux],
-                      [-uy, ux, 0]])
-        return np.identity(3) + np.sin(theta)*W + 2*np.sin(theta/2)**2 * (W @ W)
+        """Rotation matrix around the vector according to Rodrigues' formula.
+        If theta is an array of angles, return an array of rotation matrices of shape theta.shape + (3, 3)."""
+        W, W2 = self._cross_product_matrices
+        theta = np.asarray(theta)[..., np.newaxis, np.newaxis]
+        return np.identity(3) + np.sin(theta)*W + 2*np.sin(theta/2)**2 * W2
 
     def rotate_vectors(self, vectors, angle):
         vectors = np.asarray(vectors)
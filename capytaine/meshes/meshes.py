@@ -58,7 +58,7 @@ class Mesh(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject):
         self.vertices = vertices  # Not a direct assignment, goes through the setter method below.
         self.faces = faces  # Not a direct assignment, goes through the setter method below.
 
-        LOG.debug(f"New mesh: {repr(self)}")
+        LOG.debug("New mesh: %r", self)
 
         self.quadrature_method = quadrature_method
 
@@ -157,6 +157,9 @@ class Mesh(ClippableMixin, SurfaceIntegralsMixin, Abstract3DObject):
         """Dummy method to be generalized for collections of meshes."""
         return self.__short_str__()
 
+    def _tree_view_lines(self, **kwargs):
+        return [self.__short_str__()]
+
     def path_to_leaf(self):
         """Dummy method to be generalized for collection of meshes."""
         return [[]]
@@ -67,7 +67,7 @@ def mesh_disk(*, radius=1.0, center=(0, 0, 0), normal=(0, 0, 1),
     if reflection_symmetry and axial_symmetry:
         raise NotImplementedError("Disks with both symmetries have not been implemented.")
 
-    LOG.debug(f"New disk of radius {radius} and resolution {resolution}, named {name}.")
+    LOG.debug("New disk of radius %s and resolution %s, named %s.", radius, resolution, name)
 
     if reflection_symmetry:
         if ntheta % 2 == 1:
@@ -156,7 +156,7 @@ def mesh_vertical_cylinder(*, length=10.0, radius=1.0, center=(0, 0, 0),
     if name is None:
         name = f"cylinder_{next(Mesh._ids)}"
 
-    LOG.debug(f"New vertical cylinder of length {length}, radius {radius} and resolution {resolution}, named {name}.")
+    LOG.debug("New vertical cylinder of length %s, radius %s and resolution %s, named %s.", length, radius, resolution, name)
 
     if reflection_symmetry and axial_symmetry:
         raise NotImplementedError("Vertical cylinders with both symmetries have not been implemented.")
@@ -246,7 +246,7 @@ def mesh_horizontal_cylinder(*, length=10.0, radius=1.0, center=(0, 0, 0),
     if name is None:
         name = f"cylinder_{next(Mesh._ids)}"
 
-    LOG.debug(f"New horizontal cylinder of length {length}, radius {radius} and resolution {resolution}, named {name}.")
+    LOG.debug("New horizontal cylinder of length %s, radius %s and resolution %s, named %s.", length, radius, resolution, name)
 
     nr, ntheta, nx = resolution
     if faces_max_radius is not None:
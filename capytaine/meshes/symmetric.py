@@ -7,9 +7,10 @@ import reprlib
 from typing import Union, Callable, Iterable
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from capytaine.meshes.meshes import Mesh
-from capytaine.meshes.collections import CollectionOfMeshes
+from capytaine.meshes.collections import CollectionOfMeshes, indent_tree_view_lines
 from capytaine.meshes.geometry import Axis, Plane, Oz_axis, inplace_transformation
 
 LOG = logging.getLogger(__name__)
@@ -45,7 +46,13 @@ class ReflectionSymmetricMesh(SymmetricMesh):
         assert isinstance(plane, Plane)
         assert plane.normal[2] == 0, "Only vertical reflection planes are supported in ReflectionSymmetry classes."
 
-        other_half = half.mirrored(plane, name=f"mirrored_of_{half.name}")
+        if isinstance(half, Mesh):
+            # Same as in TranslationalSymmetricMesh below.
+            # The Mesh constructor copies the vertices, that are then mirrored in place.
+            other_half = Mesh(half.vertices, half.faces, name=f"mirrored_of_{half.name}",
+                              quadrature_method=half.quadrature_method).mirror(plane)
+        else:
+            other_half = half.mirrored(plane, name=f"mirrored_of_{half.name}")
 
         if name is None:
             name = f"reflection_of_{half.name}"
@@ -55,9 +62,9 @@ class ReflectionSymmetricMesh(SymmetricMesh):
         super().__init__((half, other_half), name=name)
 
         if self.name is not None:
-            LOG.debug(f"New mirror symmetric mesh: {self.name}.")
+            LOG.debug("New mirror symmetric mesh: %s.", self.name)
         else:
-            LOG.debug(f"New mirror symmetric mesh.")
+            LOG.debug("New mirror symmetric mesh.")
 
     def __str__(self):
         return f"{self.__class__.__name__}({self.half.__short_str__()}, plane={self.plane}, name=\"{self.name}\")"
@@ -74,12 +81,13 @@ class ReflectionSymmetricMesh(SymmetricMesh):
     def half(self):
         return self[0]
 
-    def tree_view(self, fold_symmetry=True, **kwargs):
+    def _tree_view_lines(self, fold_symmetry=True, **kwargs):
         if fold_symmetry:
-            return (self.__short_str__() + '\n' + ' ├─' + self.half.tree_view().replace('\n', '\n │ ') + '\n'
-                    + f" └─mirrored copy of the above {self.half.__short_str__()}")
+            return ([self.__short_str__()]
+                    + indent_tree_view_lines(self.half._tree_view_lines())
+                    + [f" └─mirrored copy of the above {self.half.__short_str__()}"])
         else:
-            return CollectionOfMeshes.tree_view(self, **kwargs)
+            return CollectionOfMeshes._tree_view_lines(self, **kwargs)
 
     def __deepcopy__(self, *args):
         return ReflectionSymmetricMesh(self.half.copy(), self.plane, name=self.name)
@@ -87,7 +95,7 @@ class ReflectionSymmetricMesh(SymmetricMesh):
     def join_meshes(*meshes, name=None):
         assert all(isinstance(mesh, ReflectionSymmetricMesh) for mesh in meshes), \
             "Only meshes with the same symmetry can be joined together."
-        assert all(meshes[0].plane == mesh.plane for mesh in meshes), \
+        assert all(meshes[0].plane == mesh.plane for mesh in meshes[1:]), \
             "Only reflection symmetric meshes with the same reflection plane can be joined together."
         half_mesh = CollectionOfMeshes([mesh.half for mesh in meshes], name=f"half_of_{name}" if name is not None else None)
         return ReflectionSymmetricMesh(half_mesh, plane=meshes[0].plane, name=name)
@@ -136,8 +144,19 @@ class TranslationalSymmetricMesh(SymmetricMesh):
         assert translation[2] == 0  # Only horizontal translation are supported.
 
         slices = [mesh_slice]
-        for i in range(1, nb_repetitions+1):
-            slices.append(mesh_slice.translated(vector=i*translation, name=f"repetition_{i}_of_{mesh_slice.name}"))
+        if isinstance(mesh_slice, Mesh):
+            # Build the new slices directly from the transformed vertices,
+            # instead of a deep copy of the slice (including its cached properties) that is then transformed.
+            # The vertices of all the repetitions are computed at once by broadcasting.
+            offsets = np.arange(1, nb_repetitions+1)[:, np.newaxis] * translation
+            all_translated_vertices = mesh_slice.vertices + offsets[:, np.newaxis, :]
+            for i, translated_vertices in enumerate(all_translated_vertices, start=1):
+                slices.append(Mesh(translated_vertices, mesh_slice.faces,
+                                   name=f"repetition_{i}_of_{mesh_slice.name}",
+                                   quadrature_method=mesh_slice.quadrature_method))
+        else:
+            for i in range(1, nb_repetitions+1):
+                slices.append(mesh_slice.translated(vector=i*translation, name=f"repetition_{i}_of_{mesh_slice.name}"))
 
         if name is None:
             name = f"translation_of_{mesh_slice.name}"
@@ -147,9 +166,9 @@ class TranslationalSymmetricMesh(SymmetricMesh):
         super().__init__(slices, name=name)
 
         if self.name is not None:
-            LOG.debug(f"New translation symmetric mesh: {self.name}.")
+            LOG.debug("New translation symmetric mesh: %s.", self.name)
         else:
-            LOG.debug(f"New translation symmetric mesh.")
+            LOG.debug("New translation symmetric mesh.")
 
     @property
     def first_slice(self):
@@ -167,12 +186,13 @@ class TranslationalSymmetricMesh(SymmetricMesh):
         yield "nb_repetitions", len(self)-1
         yield "name", self.name
 
-    def tree_view(self, fold_symmetry=True, **kwargs):
+    def _tree_view_lines(self, fold_symmetry=True, **kwargs):
         if fold_symmetry:
-            return (self.__short_str__() + '\n' + ' ├─' + self.first_slice.tree_view().replace('\n', '\n │ ') + '\n'
-                    + f" └─{len(self)-1} translated copies of the above {self.first_slice.__short_str__()}")
+            return ([self.__short_str__()]
+                    + indent_tree_view_lines(self.first_slice._tree_view_lines())
+                    + [f" └─{len(self)-1} translated copies of the above {self.first_slice.__short_str__()}"])
         else:
-            return CollectionOfMeshes.tree_view(self, **kwargs)
+            return CollectionOfMeshes._tree_view_lines(self, **kwargs)
 
     def __deepcopy__(self, *args):
         return TranslationalSymmetricMesh(self.first_slice.copy(), self.translation, nb_repetitions=len(self) - 1, name=self.name)
@@ -197,9 +217,9 @@ class TranslationalSymmetricMesh(SymmetricMesh):
     def join_meshes(*meshes, name=None):
         assert all(isinstance(mesh, TranslationalSymmetricMesh) for mesh in meshes), \
             "Only meshes with the same symmetry can be joined together."
-        assert all(np.allclose(meshes[0].translation, mesh.translation) for mesh in meshes), \
+        assert np.allclose(np.array([mesh.translation for mesh in meshes]), meshes[0].translation), \
             "Only translation symmetric meshes with the same translation vector can be joined together."
-        assert all(len(meshes[0]) == len(mesh) for mesh in meshes), \
+        assert len({len(mesh) for mesh in meshes}) == 1, \
             "Only symmetric meshes with the same number of elements can be joined together."
         mesh_strip = CollectionOfMeshes([mesh.first_slice for mesh in meshes], name=f"strip_of_{name}" if name is not None else None)
         return TranslationalSymmetricMesh(mesh_strip, translation=meshes[0].translation, nb_repetitions=len(meshes[0]) - 1, name=name)
@@ -255,9 +275,19 @@ class AxialSymmetricMesh(SymmetricMesh):
         assert isinstance(axis, Axis)
 
         slices = [mesh_slice]
-        for i in range(1, nb_repetitions+1):
-            slices.append(mesh_slice.rotated(axis, angle=2*i*np.pi/(nb_repetitions+1),
-                                             name=f"rotation_{i}_of_{mesh_slice.name}"))
+        if isinstance(mesh_slice, Mesh):
+            # Same as in TranslationalSymmetricMesh above.
+            # The vertices of all the repetitions are computed at once.
+            angles = 2*np.pi*np.arange(1, nb_repetitions+1)/(nb_repetitions+1)
+            all_rotated_vertices = (mesh_slice.vertices - axis.point) @ np.swapaxes(axis.rotation_matrix(angles), 1, 2) + axis.point
+            for i, rotated_vertices in enumerate(all_rotated_vertices, start=1):
+                slices.append(Mesh(rotated_vertices, mesh_slice.faces,
+                                   name=f"rotation_{i}_of_{mesh_slice.name}",
+                                   quadrature_method=mesh_slice.quadrature_method))
+        else:
+            for i in range(1, nb_repetitions+1):
+                slices.append(mesh_slice.rotated(axis, angle=2*i*np.pi/(nb_repetitions+1),
+                                                 name=f"rotation_{i}_of_{mesh_slice.name}"))
 
         if name is None:
             name = f"rotation_of_{mesh_slice.name}"
@@ -270,9 +300,9 @@ class AxialSymmetricMesh(SymmetricMesh):
             LOG.warning(f"{self.name} is an axi-symmetric mesh along a non vertical axis.")
 
         if self.name is not None:
-            LOG.debug(f"New rotation symmetric mesh: {self.name}.")
+            LOG.debug("New rotation symmetric mesh: %s.", self.name)
         else:
-            LOG.debug(f"New rotation symmetric mesh.")
+            LOG.debug("New rotation symmetric mesh.")
 
     @staticmethod
     def from_profile(profile: Union[Callable, Iterable[float]],
@@ -308,8 +338,15 @@ class AxialSymmetricMesh(SymmetricMesh):
             name = "axisymmetric_mesh"
 
         if callable(profile):
-            z_range = np.asarray(z_range)
-            x_values = [profile(z) for z in z_range]
+            z_range = np.asarray(z_range, dtype=float)
+            try:
+                # Try first to evaluate the profile on the whole array at once...
+                x_values = np.asarray(profile(z_range), dtype=float)
+            except Exception:  # Any failure of a function that only accepts scalars
+                x_values = None
+            if x_values is None or x_values.shape != z_range.shape:
+                # ... and fall back to one call per point for non-vectorized functions.
+                x_values = np.fromiter(map(profile, z_range), dtype=float, count=len(z_range))
             profile_array = np.stack([x_values, np.zeros(len(z_range)), z_range]).T
         else:
             profile_array = np.asarray(profile)
@@ -321,9 +358,13 @@ class AxialSymmetricMesh(SymmetricMesh):
         angle = 2 * np.pi / nphi
 
         nodes_slice = np.concatenate([profile_array, axis.rotate_points(profile_array, angle)])
-        faces_slice = np.array([[i, i+n, i+n+1, i+1] for i in range(n-1)])
+        i = np.arange(n-1)
+        faces_slice = np.stack([i, i+n, i+n+1, i+1], axis=1)
         body_slice = Mesh(nodes_slice, faces_slice, name=f"slice_of_{name}")
-        body_slice.merge_duplicates()
+        # Duplicate vertices appear when the profile touches the axis (or has repeated points).
+        # Otherwise the merging of duplicate vertices, that requires sorting all the vertices, is skipped.
+        if len(cKDTree(nodes_slice).query_pairs(r=1e-8, p=np.inf)) > 0:
+            body_slice.merge_duplicates()
         body_slice.heal_triangles()
 
         return AxialSymmetricMesh(body_slice, axis=axis, nb_repetitions=nphi - 1, name=name)
@@ -344,12 +385,13 @@ class AxialSymmetricMesh(SymmetricMesh):
         yield "nb_repetitions", len(self)-1
         yield "name", self.name
 
-    def tree_view(self, fold_symmetry=True, **kwargs):
+    def _tree_view_lines(self, fold_symmetry=True, **kwargs):
         if fold_symmetry:
-            return (self.__short_str__() + '\n' + ' ├─' + self.first_slice.tree_view().replace('\n', '\n │ ') + '\n'
-                    + f" └─{len(self)-1} rotated copies of the above {self.first_slice.__short_str__()}")
+            return ([self.__short_str__()]
+                    + indent_tree_view_lines(self.first_slice._tree_view_lines())
+                    + [f" └─{len(self)-1} rotated copies of the above {self.first_slice.__short_str__()}"])
         else:
-            return CollectionOfMeshes.tree_view(self, **kwargs)
+            return CollectionOfMeshes._tree_view_lines(self, **kwargs)
 
     def __deepcopy__(self, *args):
         return AxialSymmetricMesh(self.first_slice.copy(), axis=self.axis.copy(), nb_repetitions=len(self) - 1, name=self.name)
@@ -357,9 +399,9 @@ class AxialSymmetricMesh(SymmetricMesh):
     def join_meshes(*meshes, name=None):
         assert all(isinstance(mesh, AxialSymmetricMesh) for mesh in meshes), \
             "Only meshes with the same symmetry can be joined together."
-        assert all(meshes[0].axis == mesh.axis for mesh in meshes), \
+        assert all(meshes[0].axis == mesh.axis for mesh in meshes[1:]), \
             "Only axisymmetric meshes with the same symmetry axis can be joined together."
-        assert all(len(meshes[0]) == len(mesh) for mesh in meshes), \
+        assert len({len(mesh) for mesh in meshes}) == 1, \
             "Only axisymmetric meshes with the same number of elements can be joined together."
         mesh_slice = CollectionOfMeshes([mesh.first_slice for mesh in meshes], name=f"slice_of_{name}" if name is not None else None)
         return AxialSymmetricMesh(mesh_slice, axis=meshes[0].axis, nb_repetitions=len(meshes[0]) - 1, name=name)
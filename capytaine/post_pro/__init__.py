@@ -3,4 +3,4 @@
 
 from capytaine.post_pro.rao import rao
 from capytaine.post_pro.impedance import impedance, rao_transfer_function
-from capytaine.post_pro.kochin import compute_kochin
+from capytaine.post_pro.kochin import compute_kochin, compute_kochin_of_several_results
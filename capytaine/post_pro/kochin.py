@@ -4,10 +4,11 @@
 
 import logging
 import numpy as np
+from scipy.linalg import get_blas_funcs
 
 LOG = logging.getLogger(__name__)
 
-def compute_kochin(result, theta, ref_point=(0.0, 0.0)):
+def compute_kochin(result, theta, ref_point=(0.0, 0.0), floating_point_precision="float64"):
     """Compute the far field coefficient
 
     Parameters
@@ -18,6 +19,11 @@ def compute_kochin(result, theta, ref_point=(0.0, 0.0)):
         angles at which the coefficient is computed
     ref_point: couple of float, optional
         point of reference around which the far field coefficient is computed
+    floating_point_precision: string, optional
+        Either :code:`'float64'` (default) for double precision computations or
+        :code:`'float32'` for single precision computations,
+        which are faster for large meshes and fine grids of angles,
+        at the cost of a relative error of the order of 1e-6 on the result.
 
     Returns
     -------
@@ -25,6 +31,66 @@ def compute_kochin(result, theta, ref_point=(0.0, 0.0)):
         values of the Kochin function
     """
 
+    _check_result_for_kochin(result)
+
+    mesh = result.body.mesh
+    omega_bar = _kochin_omega_bar(mesh.faces_centers, (np.cos(theta), np.sin(theta)), ref_point)
+    return _compute_kochin(result.sources, mesh.faces_centers, mesh.faces_areas,
+                           result.wavenumber, result.water_depth, omega_bar, floating_point_precision)
+
+
+def compute_kochin_of_several_results(results, theta, ref_point=(0.0, 0.0), floating_point_precision="float64"):
+    """Compute the far field coefficient of several results.
+
+    The results sharing the same mesh, wavenumber and water depth (for instance the radiation problems
+    for all the dofs and the diffraction problems at a given frequency) are computed together,
+    such that the phase depending on theta is computed only once for all of them.
+    The projection of the faces centers on the directions theta is computed only once per mesh.
+
+    Parameters
+    ----------
+    results: list of LinearPotentialFlowResult
+        solved potential flow problems
+    theta: 1-dim array of floats
+        angles at which the coefficient is computed
+    ref_point: couple of float, optional
+        point of reference around which the far field coefficient is computed
+    floating_point_precision: string, optional
+        Either :code:`'float64'` (default) for double precision computations or
+        :code:`'float32'` for single precision computations,
+        which are faster for large meshes and fine grids of angles,
+        at the cost of a relative error of the order of 1e-6 on the result.
+
+    Returns
+    -------
+    list of arrays
+        values of the Kochin function for each result, in the same order as the results
+    """
+    groups = {}
+    for i, result in enumerate(results):
+        _check_result_for_kochin(result)
+        key = (id(result.body.mesh), result.wavenumber, result.water_depth)
+        groups.setdefault(key, []).append(i)
+
+    cos_sin_theta = (np.cos(theta), np.sin(theta))
+    omega_bars = {}
+
+    kochins = [None] * len(results)
+    for (mesh_id, k, h), indices in groups.items():
+        mesh = results[indices[0]].body.mesh
+        if mesh_id not in omega_bars:
+            omega_bars[mesh_id] = _kochin_omega_bar(mesh.faces_centers, cos_sin_theta, ref_point)
+        # all_sources.shape = (nb_faces, nb_results_in_group)
+        all_sources = np.stack([results[i].sources for i in indices], axis=1)
+        # all_kochins.shape = (nb_theta, nb_results_in_group)
+        all_kochins = _compute_kochin(all_sources, mesh.faces_centers, mesh.faces_areas,
+                                      k, h, omega_bars[mesh_id], floating_point_precision)
+        for j, i in enumerate(indices):
+            kochins[i] = all_kochins[..., j]
+    return kochins
+
+
+def _check_result_for_kochin(result):
     if result.forward_speed != 0.0:
         LOG.warning("Kochin functions with forward speed have never been validated.")
 
@@ -33,22 +99,80 @@ def compute_kochin(result, theta, ref_point=(0.0, 0.0)):
         They probably have not been stored by the solver because the option keep_details=True have not been set.
         Please re-run the resolution with this option.""")
 
-    k = result.wavenumber
-    h = result.water_depth
 
+def _kochin_omega_bar(faces_centers, cos_sin_theta, ref_point=(0.0, 0.0)):
+    """Horizontal projection of the faces centers on the directions of angles theta,
+    given as the couple (np.cos(theta), np.sin(theta))."""
     # omega_bar.shape = (nb_faces, 2) @ (2, nb_theta)
-    omega_bar = (result.body.mesh.faces_centers[:, 0:2] - ref_point) @ (np.cos(theta), np.sin(theta))
+    return (faces_centers[:, 0:2] - ref_point) @ cos_sin_theta
 
-    if 0 <= k*h < 20:
-        cih = np.cosh(k*(result.body.mesh.faces_centers[:, 2]+h))/np.cosh(k*h)
+
+def _kochin_cih(k, h, z):
+    """Vertical dependency of the Kochin function: :math:`\\cosh(k(z+h))/\\cosh(kh)`,
+    or its deep water approximation :math:`e^{kz}` when :math:`kh \\geq 20`.
+
+    The wavenumber can also be an array, in which case the returned array has shape k.shape + z.shape.
+    """
+    k = np.asarray(k)[..., np.newaxis]
+    # Both expressions are evaluated everywhere, possibly with overflows
+    # or undefined values (e.g. 0*inf) where they are not used.
+    with np.errstate(over='ignore', invalid='ignore'):
+        kh = k*h
+        return np.where((0 <= kh) & (kh < 20), np.cosh(k*(z+h))/np.cosh(kh), np.exp(k*z))
+
+
+def _compute_kochin(sources, faces_centers, faces_areas, k, h, omega_bar, floating_point_precision="float64"):
+    """Compute the far field coefficient from the sources distribution and the properties of the mesh.
+    The properties of the mesh are passed as arrays, such that they can be reused for several results.
+    The dependency in theta is given by omega_bar, as computed by :func:`_kochin_omega_bar`.
+    The sources can be an array of shape (nb_faces,) or (nb_faces, nb_results),
+    in which case the Kochin functions of all the results are returned as an array of shape (nb_theta, nb_results).
+    See :func:`compute_kochin` for the other parameters."""
+
+    if floating_point_precision == "float32":
+        dtype = "complex64"
+    elif floating_point_precision == "float64":
+        dtype = "complex128"
     else:
-        cih = np.exp(k*result.body.mesh.faces_centers[:, 2])
+        raise NotImplementedError
 
-    # cih.shape = (nb_faces,)
-    # omega_bar.T.shape = (nb_theta, nb_faces)
-    # result.body.mesh.faces_areas.shape = (nb_faces,)
-    zs = cih * np.exp(-1j * k * omega_bar.T) * result.body.mesh.faces_areas
+    cih = _kochin_cih(k, h, faces_centers[:, 2])
+
+    # The factors that depend only on the faces are applied to the sources
+    # before the product with the array depending on theta.
+    # cih.shape = faces_areas.shape = (nb_faces,)
+    # sources.shape = (nb_faces,) or (nb_faces, nb_results)
+    weighted_sources = ((cih * faces_areas).reshape((-1,) + (1,)*(np.ndim(sources)-1)) * sources).astype(dtype, copy=False)
+
+    # The phase is computed in place in a single complex array.
+    # phase.shape = omega_bar.shape = (nb_faces, nb_theta)
+    if floating_point_precision == "float32":
+        # The argument of the exponential is reduced modulo 2π (to [-π, π]) in double precision before being rounded,
+        # otherwise the error would grow with the distance of the body from ref_point.
+        # np.rint is used instead of np.remainder, that is much slower.
+        k_omega_bar = np.multiply(k, omega_bar)
+        nb_periods = np.rint(k_omega_bar/(2*np.pi))
+        nb_periods *= 2*np.pi
+        k_omega_bar -= nb_periods
+        del nb_periods
+        k_omega_bar = k_omega_bar.astype(np.float32)
+        # exp(-i x) = cos(x) - i sin(x), with the real functions that are faster than the complex exponential in single precision.
+        phase = np.empty(k_omega_bar.shape, dtype=dtype)
+        np.cos(k_omega_bar, out=phase.real)
+        np.sin(k_omega_bar, out=phase.imag)
+        np.negative(phase.imag, out=phase.imag)
+    else:
+        phase = np.multiply(-1j*k, omega_bar, dtype=dtype)
+        np.exp(phase, out=phase)
 
-    # zs.shape = (nb_theta, nb_faces)
-    # result.sources.shape = (nb_faces,)
-    return zs @ result.sources/(4*np.pi)
+    if phase.ndim == 2 and weighted_sources.ndim == 1:
+        # Direct call to BLAS matrix-vector product, without the overhead of numpy's matmul.
+        # phase.T is Fortran-contiguous, such that it is not copied.
+        gemv = get_blas_funcs('gemv', (phase, weighted_sources))
+        return gemv(1/(4*np.pi), phase.T, weighted_sources)
+    elif phase.ndim == 2:
+        # Same as above with a matrix-matrix product for several results.
+        gemm = get_blas_funcs('gemm', (phase, weighted_sources))
+        return gemm(1/(4*np.pi), phase.T, weighted_sources)
+    else:  # Single value of theta
+        return phase @ weighted_sources/(4*np.pi)
@@ -93,6 +93,9 @@ class SymbolicMultiplication:
     def reshape(self, *args):
         return SymbolicMultiplication(self.symbol, self.value.reshape(*args))
 
+    def __getitem__(self, item):
+        return SymbolicMultiplication(self.symbol, self.value[item])
+
 
 def supporting_symbolic_multiplication(f):
     @wraps(f)
@@ -128,6 +128,26 @@ def test_symmetry_of_the_green_function_finite_depth(gf):
     assert dg1_antisym == approx(-dg2_antisym)
 
 
+def test_python_prony_decomposition():
+    k = 1.0
+    depth = 3.0
+    gf = cpt.Delhommeau(finite_depth_prony_decomposition_method="python")
+    a, lamda = gf.find_best_exponential_decomposition(k*depth*np.tanh(k*depth), k*depth)
+    X = np.linspace(-0.1, 20.0, 101)
+    f = gf.fortran_core.old_prony_decomposition.ff_array(X, k*depth*np.tanh(k*depth), k*depth)
+    assert f == approx([gf.fortran_core.old_prony_decomposition.ff(x, k*depth*np.tanh(k*depth), k*depth) for x in X])
+    assert a[:-1] @ np.exp(np.outer(lamda[:-1], X)) == approx(f, abs=5e-2)
+
+
+def test_prony_decomposition_cache_ignores_round_off():
+    k = 1.0
+    depth = 3.0
+    gf = cpt.Delhommeau()
+    a, lamda = gf.find_best_exponential_decomposition(k*depth*np.tanh(k*depth), k*depth)
+    a_, lamda_ = gf.find_best_exponential_decomposition(k*depth*np.tanh(k*depth)*(1+1e-15), k*depth*(1-1e-15))
+    assert a is a_ and lamda is lamda_
+
+
 def test_floating_point_precision():
     assert cpt.Delhommeau(floating_point_precision="float64").tabulated_integrals.dtype == np.float64
     assert cpt.Delhommeau(floating_point_precision="float32").tabulated_integrals.dtype == np.float32
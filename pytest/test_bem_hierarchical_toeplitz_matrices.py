@@ -176,6 +176,25 @@ def test_low_rank_matrices(method):
     assert np.isclose(result.radiation_dampings['buoy__Heave'], result2.radiation_dampings['buoy__Heave'], atol=10.0)
 
 
+def test_accuracy_of_low_rank_blocks_in_translational_symmetry():
+    """With ACA blocks in the hierarchical matrix, the result should stay close to the dense resolution."""
+    mesh = cpt.mesh_horizontal_cylinder(length=10.0, radius=1.0, center=(0, 0, -2), resolution=(2, 8, 20),
+                                        reflection_symmetry=False, translation_symmetry=True)
+    body = FloatingBody(mesh=mesh, dofs=cpt.rigid_body_dofs())
+    engine = cpt.HierarchicalToeplitzMatrixEngine(ACA_distance=2, matrix_cache_size=0)
+    solver_with_aca = cpt.BEMSolver(engine=engine)
+
+    S, V = engine.build_matrices(mesh, mesh, 0.0, np.inf, 1.0, solver_with_aca.green_function)
+    assert any(isinstance(block, LowRankMatrix) for block in S.all_blocks.flat)
+
+    problem = RadiationProblem(body=body, omega=1.0, radiating_dof="Heave")
+    result = solver_with_aca.solve(problem)
+    result2 = solver_without_sym.solve(problem)
+    assert np.isclose(result.added_masses['Heave'], result2.added_masses['Heave'], rtol=2e-4)
+    # The radiation damping is more sensitive to the approximation with such a small ACA_distance.
+    assert np.isclose(result.radiation_dampings['Heave'], result2.radiation_dampings['Heave'], rtol=1e-2)
+
+
 @pytest.mark.parametrize("method,adjoint_double_layer",zip(method,adjoint_double_layer))
 def test_array_of_spheres(method,adjoint_double_layer):
     radius = 1.0
@@ -149,6 +149,16 @@ def test_radiation_problem(sphere, caplog):
     assert res.radiation_damping == res.radiation_dampings == {"Heave": 2.0}
 
 
+def test_group_for_parallel_resolution(sphere):
+    problems = [cpt.RadiationProblem(body=sphere, omega=omega, rho=rho)
+                for omega in [1.0, 2.0] for rho in [1000.0, 1025.0]]
+    problems += [cpt.DiffractionProblem(body=sphere, omega=1.0, wave_direction=0.0)]
+    groups = LinearPotentialFlowProblem._group_for_parallel_resolution(problems)
+    assert sorted(len(grp) for grp in groups) == [2, 3]
+    for grp in groups:
+        assert len(set(pb.omega for pb in grp)) == 1
+
+
 @pytest.mark.parametrize("cal_file", ["Nemoh.cal", "Nemoh_v3.cal"])
 def test_import_cal_file(cal_file):
     """Test the importation of legacy Nemoh.cal files."""
@@ -5,6 +5,7 @@
 import os
 import pytest
 import logging
+from functools import lru_cache
 from unittest import mock
 from pathlib import Path
 
@@ -194,6 +195,10 @@ def test_hst_ignored_lines(caplog):
 
 #################################################################
 
+# The meshes are generated only once per test session, since the meshing with gmsh is slow.
+# The tests below should not modify the returned meshio objects.
+
+@lru_cache(maxsize=None)
 def generate_pygmsh_wavebot():
     T1=0.16
     T2=0.37
@@ -209,6 +214,7 @@ def generate_pygmsh_wavebot():
     vol_exp = np.pi*T1*r1**2 + 1/3 * np.pi * T2 * (r2**2 + r2 * r1 + r1**2)
     return (mesh, vol_exp)
 
+@lru_cache(maxsize=None)
 def generate_pygmsh_cylinder():
     T=0.52
     r1=0.88
@@ -219,6 +225,7 @@ def generate_pygmsh_cylinder():
     vol_exp = np.pi*r1**2*T
     return (mesh, vol_exp)
 
+@lru_cache(maxsize=None)
 def generate_pygmsh_sphere():
     r1=0.88
     with pygmsh.occ.Geometry() as geom:
@@ -119,8 +119,10 @@ def test_solve_directly_block_circulant_problem(solved_block_circulant_problem):
 def test_solve_with_lu_block_circulant_problem(solved_block_circulant_problem):
     A, x_ref, b = solved_block_circulant_problem
     linear_solver = LUSolverWithCache()
-    with pytest.raises(NotImplementedError):
-        x = linear_solver.solve(A, b)
+    x = linear_solver.solve(A, b)
+    assert np.allclose(x, x_ref, rtol=1e-10)
+    x = linear_solver.solve(A, b)  # Reuse cached decomposition
+    assert np.allclose(x, x_ref, rtol=1e-10)
 
 def test_gmres_block_circulant_problem(solved_block_circulant_problem):
     A, x_ref, b = solved_block_circulant_problem
@@ -402,10 +402,20 @@ def test_low_rank_blocks():
     # Test recompression
     recompressed = dumb_low_rank.recompress(new_rank=2)
     assert recompressed.rank == matrix_rank(recompressed.full_matrix()) == 2
+    assert np.allclose(recompressed.full_matrix(), A)  # A is actually of rank 2
 
     recompressed = dumb_low_rank.recompress(tol=1e-1)
     assert recompressed.rank <= dumb_low_rank.rank
 
+    # The tolerance is on the relative error in Frobenius norm
+    B = np.random.rand(n, n) @ np.diag(0.5**np.arange(n)) @ np.random.rand(n, n)
+    B_low_rank = LowRankMatrix.from_full_matrix_with_SVD(B, n)
+    for tol in [1e-1, 1e-3]:
+        recompressed = B_low_rank.recompress(tol=tol)
+        assert recompressed.rank < n
+        assert np.linalg.norm(recompressed.full_matrix() - B) <= tol*np.linalg.norm(B)
+        assert np.linalg.norm(B_low_rank.recompress(new_rank=recompressed.rank-1).full_matrix() - B) > tol*np.linalg.norm(B)
+
     # Test multiplication with vector
     b = np.random.rand(n)
     assert np.allclose(A_rank_1 @ b, A_rank_1.full_matrix() @ b)
@@ -77,6 +77,26 @@ def test_collection():
     assert np.allclose(sphere.diameter_of_nodes, sphere.merged().diameter_of_nodes)
 
 
+def test_axisymmetric_mesh_from_vectorized_or_scalar_profile():
+    """The profile function may or may not support being evaluated on an array."""
+    z_range = np.linspace(-2.0, 0.0, 9)
+    vectorized = AxialSymmetricMesh.from_profile(lambda z: 1.0 - 0.2*z, z_range=z_range, nphi=6)
+    scalar = AxialSymmetricMesh.from_profile(lambda z: 1.0 - 0.2*z if z < 0.0 else 1.0, z_range=z_range, nphi=6)
+    constant = AxialSymmetricMesh.from_profile(lambda z: 1.0, z_range=z_range, nphi=6)
+
+    def scalar_only_profile(z):
+        # float.is_integer is not defined for numpy arrays,
+        # so calling this function on an array raises an AttributeError.
+        return 1.0 if z.is_integer() else 1.0 - 0.2*z
+
+    scalar_only = AxialSymmetricMesh.from_profile(scalar_only_profile, z_range=z_range, nphi=6)
+    same_vectorized = AxialSymmetricMesh.from_profile(lambda z: np.where(z % 1 == 0, 1.0, 1.0 - 0.2*z), z_range=z_range, nphi=6)
+    assert np.allclose(vectorized.merged().vertices, scalar.merged().vertices)
+    assert np.all(vectorized.merged().faces == scalar.merged().faces)
+    assert np.allclose(scalar_only.merged().vertices, same_vectorized.merged().vertices)
+    assert constant.nb_faces == vectorized.nb_faces
+
+
 def test_join_axisymmetric_disks():
     """Given two axisymmetric meshes with the same axis, build a new axisymmetric mesh combining the two."""
     disk1 = Disk(radius=1.0, center=(-1, 0, 0), resolution=(6, 6), normal=(1, 0, 0), axial_symmetry=True).mesh
@@ -69,6 +69,15 @@ def test_rotation_non_reference_axis():
     assert np.allclose(rotated_point, p)
 
 
+def test_rotation_matrix_of_several_angles():
+    axis = Axis(vector=(1, 2, 3), point=(0, 0, 0))
+    angles = np.linspace(0, 2*np.pi, 5)
+    matrices = axis.rotation_matrix(angles)
+    assert matrices.shape == (5, 3, 3)
+    for angle, matrix in zip(angles, matrices):
+        assert np.allclose(matrix, axis.rotation_matrix(angle))
+
+
 def test_invariance_of_rotation_center():
     p = np.random.rand(3)
     axis1 = Axis(vector=(0, 0, 1), point=p)
@@ -113,3 +113,45 @@ def test_fill_dataset_with_kochin_functions():
     # Because of the symmetries of the body
     assert np.isclose(ds['kochin_diffraction'].sel(wave_direction=-pi/2, theta=0.0),
                       ds['kochin_diffraction'].sel(wave_direction=0.0, theta=pi/2))
+
+def test_kochin_cih_for_several_wavenumbers():
+    from capytaine.post_pro.kochin import _kochin_cih
+    z = np.linspace(-2.0, 0.0, 5)
+    wavenumbers = np.array([0.1, 1.0, 10.0])
+    for h in [3.0, np.inf]:
+        cih = _kochin_cih(wavenumbers, h, z)
+        assert cih.shape == (3, 5)
+        for k, cih_k in zip(wavenumbers, cih):
+            assert np.allclose(cih_k, _kochin_cih(k, h, z))
+    assert np.allclose(_kochin_cih(wavenumbers, np.inf, z), np.exp(np.outer(wavenumbers, z)))
+
+def test_kochin_of_several_results():
+    from capytaine.post_pro.kochin import compute_kochin, compute_kochin_of_several_results
+    mesh = cpt.mesh_sphere().immersed_part()
+    body = cpt.FloatingBody(mesh=mesh, dofs=cpt.rigid_body_dofs())
+    solver = cpt.BEMSolver()
+    problems = [cpt.RadiationProblem(body=body, wavelength=wl, radiating_dof=dof)
+                for wl in [2.0, 5.0] for dof in ["Surge", "Heave"]]
+    problems += [cpt.DiffractionProblem(body=body, wavelength=2.0, wave_direction=0.0)]
+    results = solver.solve_all(problems, keep_details=True)
+    for theta in [np.linspace(0.0, np.pi, 5), 0.5]:
+        kochins = compute_kochin_of_several_results(results, theta)
+        for res, kochin in zip(results, kochins):
+            assert np.allclose(kochin, compute_kochin(res, theta))
+
+@pytest.mark.parametrize("x", [0.0, 1000.0])
+def test_kochin_single_precision(x):
+    # The accuracy should not depend on the distance of the body from ref_point.
+    from capytaine.post_pro.kochin import compute_kochin, compute_kochin_of_several_results
+    mesh = cpt.mesh_sphere(center=(x, 0.0, 0.0)).immersed_part()
+    body = cpt.FloatingBody(mesh=mesh, dofs=cpt.rigid_body_dofs())
+    solver = cpt.BEMSolver()
+    problems = [cpt.RadiationProblem(body=body, wavelength=2.0, radiating_dof=dof) for dof in ["Surge", "Heave"]]
+    results = solver.solve_all(problems, keep_details=True)
+    theta = np.linspace(0.0, np.pi, 5)
+    for res, kochin in zip(results, compute_kochin_of_several_results(results, theta, floating_point_precision="float32")):
+        kochin_64 = compute_kochin(res, theta)
+        assert kochin.dtype == np.complex64
+        assert np.allclose(kochin, kochin_64, rtol=1e-5, atol=1e-6*np.abs(kochin_64).max())
+        assert np.allclose(compute_kochin(res, theta, floating_point_precision="float32"), kochin,
+                           rtol=1e-5, atol=1e-6*np.abs(kochin_64).max())
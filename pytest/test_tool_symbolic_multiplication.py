@@ -50,6 +50,11 @@ def test_numpy_matmul():
     c = A @ b
     assert (c/zero).shape == (10,)
 
+def test_numpy_array_indexing():
+    zero = SymbolicMultiplication("0")
+    b = np.arange(10) * zero
+    assert b[3] / zero == 3
+
 def test_supporting_symbolic_multiplication():
     zero = SymbolicMultiplication("0")
 